@@ -6,10 +6,12 @@ and ensures all assets are CMYK-compliant before embedding.
 """
 
 import os
+import math
 import hashlib
+import functools
 import logging
-from typing import Optional, Tuple
-from PIL import Image, ImageDraw, ImageFont
+from typing import Dict, List, Optional, Tuple
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 from dataclasses import dataclass
 
 from color_management import (
@@ -20,6 +22,14 @@ from color_management import (
 
 logger = logging.getLogger(__name__)
 
+# Radial glow falloff ``1 - (d / r) ** 1.5`` tabulated over the 0-255 values of
+# Image.radial_gradient, whose inscribed circle (radius 128px) reaches 255 / sqrt(2)
+_RADIAL_EDGE_VALUE = 255 / math.sqrt(2)
+_RADIAL_FALLOFF_LUT = tuple(
+    1 - (v / _RADIAL_EDGE_VALUE) ** 1.5 if v < _RADIAL_EDGE_VALUE else 0.0
+    for v in range(256)
+)
+
 
 @dataclass
 class GradientConfig:
@@ -150,14 +160,18 @@ class AssetPipeline:
         return output_path
     
     def prepare_vignette_image(self, source_path: str, config: VignetteConfig,
-                               output_name: Optional[str] = None) -> str:
+                               output_name: Optional[str] = None,
+                               max_width_px: Optional[int] = None) -> str:
         """
         Apply vignette fade to an image.
         
         Args:
             source_path: Path to source image
             config: Vignette configuration
-            output_name: Optional output filename (otherwise uses cache key)
+            output_name: Optional output filename (otherwise uses cache key);
+                a max_width_px cap is appended to its stem
+            max_width_px: Optional cap on output width, e.g. the placed width
+                at the preferred effective DPI
         
         Returns:
             Path to vignetted image
@@ -166,8 +180,14 @@ class AssetPipeline:
         source_hash = hashlib.md5(source_path.encode()).hexdigest()[:8]
         vignette_hash = config.get_cache_key()
         cache_key = f"{source_hash}_{vignette_hash}"
+        if max_width_px:
+            cache_key = f"{cache_key}_{max_width_px}w"
         
         if output_name:
+            if max_width_px:
+                # Keep differently sized renders apart in the cache
+                stem, ext = os.path.splitext(output_name)
+                output_name = f"{stem}_{max_width_px}w{ext}"
             output_path = self.cache.get_path(output_name, "")
         else:
             output_path = self.cache.get_path(cache_key)
@@ -199,7 +219,8 @@ class AssetPipeline:
             output_path,
             edge_fade=config.edge_fade,
             bottom_fade=config.bottom_fade,
-            top_fade=config.top_fade
+            top_fade=config.top_fade,
+            max_width_px=max_width_px
         )
 
         return actual_output
@@ -371,6 +392,67 @@ def create_bottom_fade_mask(width: int, height: int, fade_percentage: float = 0.
     return mask
 
 
+@functools.lru_cache(maxsize=4)
+def _radial_falloff_image(max_alpha: int) -> Image.Image:
+    """Rasterize the radial falloff (256x256, 'L') scaled to max_alpha."""
+    return Image.radial_gradient("L").point([int(max_alpha * f) for f in _RADIAL_FALLOFF_LUT])
+
+
+def create_radial_glow_image(width_px: int, height_px: int, spots: List[Dict[str, float]],
+                             color_rgb: Tuple[int, int, int] = (90, 180, 190),
+                             max_alpha: int = 60) -> Image.Image:
+    """
+    Create a white RGB image with soft radial color accents.
+    
+    Each spot fades from max_alpha at its centre to 0 at its radius
+    (``1 - (d / r) ** 1.5`` falloff); overlapping spots add up, clamped at
+    full opacity. The falloff is rasterized once by Pillow and scaled per
+    spot, so no per-pixel Python work is done.
+    
+    Args:
+        width_px: Image width in pixels
+        height_px: Image height in pixels
+        spots: Dicts with "x", "y" (0-1, y measured from the bottom) and
+            "radius" (fraction of the longer side)
+        color_rgb: Accent color
+        max_alpha: Opacity at the centre of each spot (0-255)
+    
+    Returns:
+        PIL Image in 'RGB' mode
+    """
+    falloff = _radial_falloff_image(max_alpha)
+    
+    alpha = Image.new("L", (width_px, height_px), 0)
+    for spot in spots:
+        cx = int(spot["x"] * width_px)
+        cy = int((1 - spot["y"]) * height_px)  # Flip Y for image coords
+        radius = int(spot["radius"] * max(width_px, height_px))
+        if radius <= 0:
+            continue
+        
+        # Clip the spot's bounding square to the image
+        left, top = max(0, cx - radius), max(0, cy - radius)
+        right, bottom = min(width_px, cx + radius), min(height_px, cy + radius)
+        if left >= right or top >= bottom:
+            continue
+        
+        # Scale only the visible part of the falloff up to the spot size
+        scale = falloff.width / (2 * radius)
+        source_box = (
+            (left - cx + radius) * scale, (top - cy + radius) * scale,
+            (right - cx + radius) * scale, (bottom - cy + radius) * scale
+        )
+        spot_alpha = falloff.resize((right - left, bottom - top),
+                                    Image.Resampling.BILINEAR, box=source_box)
+        
+        region = (left, top, right, bottom)
+        alpha.paste(ImageChops.add(alpha.crop(region), spot_alpha), region)
+    
+    background = Image.new("RGB", (width_px, height_px), (255, 255, 255))
+    accent = Image.new("RGB", (width_px, height_px), color_rgb)
+    return Image.composite(accent, background, alpha)
+
+
 def calculate_dpi_for_size(width_mm: float, height_mm: float,
                            width_pts: float, height_pts: float,
                            target_dpi: int = 300) -> Tuple[int, int]:
@@ -14,8 +14,11 @@ from PIL import Image
 import tempfile
 
 from graphics_config import GraphicsConfig
-from canvas_utils import ExhibitGraphicV2, CMYKCanvas, fit_multiline_font_size
-from asset_pipeline import AssetPipeline, GradientConfig, VignetteConfig
+from canvas_utils import (
+    ExhibitGraphicV2, CMYKCanvas, fit_multiline_text, unit_string_widths, load_image,
+    load_image_reader, points_to_pixels, register_headline_font
+)
+from asset_pipeline import AssetPipeline, GradientConfig, VignetteConfig, create_radial_glow_image
 from color_management import BRAND_COLORS_CMYK, BRAND_COLORS_RGB
 
 
@@ -51,21 +54,11 @@ class BackwallLayout:
     
     def _get_font_name(self) -> str:
         """Get headline font name, registering if needed."""
-        from reportlab.pdfbase.ttfonts import TTFont
-        
-        preferred_font = "Ubuntu-Bold"
-        if preferred_font in pdfmetrics.getRegisteredFontNames():
-            return preferred_font
-        
-        font_path = self.config.assets.ubuntu_bold_font
-        if os.path.exists(font_path):
-            try:
-                pdfmetrics.registerFont(TTFont(preferred_font, font_path))
-                return preferred_font
-            except Exception as e:
-                logger.warning(f"Could not register Ubuntu font: {e}. Using Helvetica-Bold.")
-        
-        return "Helvetica-Bold"
+        return register_headline_font(self.config.assets.ubuntu_bold_font)
+    
+    def _image_dpi(self) -> int:
+        """Resolution raster assets are downsampled to before embedding."""
+        return self.config.spec.print_spec.preferred_effective_dpi
     
     def _draw_background(self):
         """Draw background with radial gradient accents."""
@@ -78,17 +71,7 @@ class BackwallLayout:
         width_px = int(width_mm * (dpi / 25.4))
         height_px = int(height_mm * (dpi / 25.4))
         
-        # For now, use PIL-based gradient generation (matching original)
-        # TODO: Migrate to pure CMYK gradient using asset_pipeline
-        from PIL import Image, ImageDraw
-        import tempfile
-        
-        # Create white background
-        bg_img = Image.new("RGB", (width_px, height_px), (255, 255, 255))
-        overlay = Image.new("RGBA", (width_px, height_px), (0, 0, 0, 0))
-        
         # Teal gradient spots
-        teal_rgb = (90, 180, 190)
         gradient_spots = [
             {"x": 0.15, "y": 0.15, "radius": 0.35},
             {"x": 0.85, "y": 0.50, "radius": 0.30},
@@ -96,39 +79,30 @@ class BackwallLayout:
             {"x": 0.80, "y": 0.90, "radius": 0.22},
         ]
         
-        for spot in gradient_spots:
-            cx = int(spot["x"] * width_px)
-            cy = int((1 - spot["y"]) * height_px)
-            max_radius = int(spot["radius"] * max(width_px, height_px))
-            
-            for y in range(max(0, cy - max_radius), min(height_px, cy + max_radius)):
-                for x in range(max(0, cx - max_radius), min(width_px, cx + max_radius)):
-                    dist = ((x - cx)**2 + (y - cy)**2) ** 0.5
-                    if dist < max_radius:
-                        alpha = int(60 * (1 - (dist / max_radius) ** 1.5))
-                        if alpha > 0:
-                            existing = overlay.getpixel((x, y))
-                            new_alpha = min(255, existing[3] + alpha)
-                            overlay.putpixel((x, y), (*teal_rgb, new_alpha))
-        
-        bg_img.paste(overlay, (0, 0), overlay)
-        
-        # Save and draw
+        # TODO: Migrate to pure CMYK gradient using asset_pipeline
+        bg_img = create_radial_glow_image(width_px, height_px, gradient_spots, color_rgb=(90, 180, 190))
+        
+        if not self.config.use_cmyk:
+            # RGB background can be embedded straight from memory
+            self.canvas.draw_cmyk_image(
+                bg_img, 0, 0,
+                width=self.graphic.doc_width,
+                height=self.graphic.doc_height,
+                preserve_aspect=False
+            )
+            return
+        
+        # Save and convert to CMYK
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
             tmp_path = tmp.name
             bg_img.save(tmp_path)
         
         try:
-            # Convert to CMYK if needed
-            if self.config.use_cmyk:
-                cmyk_path = self.asset_pipeline.ensure_cmyk_asset(tmp_path, "backwall_bg.png")
-                image_path = cmyk_path
-            else:
-                image_path = tmp_path
+            cmyk_path = self.asset_pipeline.ensure_cmyk_asset(tmp_path, "backwall_bg.png")
 
             # Use CMYK-aware image drawing
             self.canvas.draw_cmyk_image(
-                image_path, 0, 0,
+                cmyk_path, 0, 0,
                 width=self.graphic.doc_width,
                 height=self.graphic.doc_height,
                 preserve_aspect=False
@@ -158,12 +132,13 @@ class BackwallLayout:
             face_path = self.asset_pipeline.prepare_vignette_image(
                 self.config.assets.face_image,
                 vignette_config,
-                output_name="face_vignetted.png"
+                output_name="face_vignetted.png",
+                max_width_px=points_to_pixels(self.graphic.trim_width, self._image_dpi())
             )
             
-            # Calculate dimensions
-            face_img = Image.open(face_path)
-            face_ratio = face_img.height / face_img.width
+            # Only the header is read; the JPEG is embedded undecoded
+            with Image.open(face_path) as face_img:
+                face_ratio = face_img.height / face_img.width
             
             face_width = self.graphic.trim_width
             face_height = face_width * face_ratio
@@ -216,12 +191,13 @@ class BackwallLayout:
             eyes_path = self.asset_pipeline.prepare_vignette_image(
                 self.config.assets.eyes_image,
                 vignette_config,
-                output_name="eyes_vignetted.png"
+                output_name="eyes_vignetted.png",
+                max_width_px=points_to_pixels(self.graphic.trim_width, self._image_dpi())
             )
             
-            # Calculate dimensions
-            eyes_img = Image.open(eyes_path)
-            eyes_ratio = eyes_img.height / eyes_img.width
+            # Only the header is read; the JPEG is embedded undecoded
+            with Image.open(eyes_path) as eyes_img:
+                eyes_ratio = eyes_img.height / eyes_img.width
             
             eyes_width = self.graphic.trim_width
             eyes_height = eyes_width * eyes_ratio
@@ -258,7 +234,7 @@ class BackwallLayout:
         
         # Calculate font size
         max_headline_width = safe_width * 0.92
-        headline_font_size = fit_multiline_font_size(
+        headline_font_size, max_text_width = fit_multiline_text(
             [self.headline_line1, self.headline_line2],
             headline_font,
             max_headline_width,
@@ -270,6 +246,7 @@ class BackwallLayout:
         headline_center_x = self.graphic.doc_width / 2
         ascent, descent = pdfmetrics.getAscentDescent(headline_font, headline_font_size)
         line_height = ascent - descent
+        descent_offset = descent * headline_font_size / 1000
         baseline_gap = line_height * 1.60
         
         first_baseline = self.graphic.bleed + (self.headline_position_y_mm * mm)
@@ -281,13 +258,9 @@ class BackwallLayout:
             if first_baseline - line_height < min_y:
                 first_baseline = min_y + line_height
         
-        # Calculate text widths
-        text_width_line1 = pdfmetrics.stringWidth(self.headline_line1, headline_font, headline_font_size)
-        text_width_line2 = pdfmetrics.stringWidth(self.headline_line2, headline_font, headline_font_size)
-        max_text_width = max(text_width_line1, text_width_line2)
-        
-        # Load logo dimensions
-        logo_width, logo_height = self._get_logo_dimensions(safe_width)
+        # Load logo once and derive its dimensions
+        logo_img = self._load_logo()
+        logo_width, logo_height = self._get_logo_dimensions(safe_width, logo_img)
         
         # Calculate box dimensions
         bg_padding_h = 30 * mm
@@ -296,7 +269,7 @@ class BackwallLayout:
         logo_gap = 60 * mm
         
         bg_x = headline_center_x - (max_text_width / 2) - bg_padding_h
-        bg_y = first_baseline - baseline_gap - (descent * headline_font_size / 1000) - bg_padding_bottom - logo_height - logo_gap
+        bg_y = first_baseline - baseline_gap - descent_offset - bg_padding_bottom - logo_height - logo_gap
         bg_width = max_text_width + (2 * bg_padding_h)
         bg_height = line_height + baseline_gap + bg_padding_top + bg_padding_bottom + logo_height + logo_gap
         bg_radius = 40 * mm
@@ -310,42 +283,54 @@ class BackwallLayout:
         # Draw text
         text_color = BRAND_COLORS_CMYK["headline_text"] if self.config.use_cmyk else BRAND_COLORS_RGB["headline_text"]
         
+        # Centre each line from the fitter's cached widths rather than having
+        # drawCentredString measure it again
+        headline_lines = (self.headline_line1, self.headline_line2)
+        unit_widths = unit_string_widths(headline_lines, headline_font)
+        baselines = (first_baseline, first_baseline - baseline_gap)
+        positioned_lines = [
+            (line, headline_center_x - (unit_width * headline_font_size / 2), baseline)
+            for line, unit_width, baseline in zip(headline_lines, unit_widths, baselines)
+        ]
+        
         if self.config.use_cmyk:
-            self.canvas.draw_text_cmyk(
-                self.headline_line1, headline_center_x, first_baseline,
-                headline_font, headline_font_size, text_color, alpha=1.0, centered=True
-            )
-            self.canvas.draw_text_cmyk(
-                self.headline_line2, headline_center_x, first_baseline - baseline_gap,
-                headline_font, headline_font_size, text_color, alpha=1.0, centered=True
+            self.canvas.draw_text_lines_cmyk(
+                positioned_lines, headline_font, headline_font_size, text_color, alpha=1.0
             )
         else:
             self.canvas.canvas.setFillColor(text_color)
             self.canvas.canvas.setFont(headline_font, headline_font_size)
-            self.canvas.canvas.drawCentredString(headline_center_x, first_baseline, self.headline_line1)
-            self.canvas.canvas.drawCentredString(headline_center_x, first_baseline - baseline_gap, self.headline_line2)
+            for line, x, baseline in positioned_lines:
+                self.canvas.canvas.drawString(x, baseline, line)
         
         # Draw logo
         if logo_width > 0:
             self._draw_logo(
                 headline_center_x,
-                first_baseline - baseline_gap - (descent * headline_font_size / 1000) - logo_gap,
+                first_baseline - baseline_gap - descent_offset - logo_gap,
                 logo_width,
                 logo_height
             )
     
-    def _get_logo_dimensions(self, safe_width: float) -> tuple[float, float]:
+    def _load_logo(self) -> Optional[Image.Image]:
+        """Load the decoded logo, or None if it is missing."""
+        try:
+            return load_image(self.config.assets.logo)
+        except FileNotFoundError:
+            logger.warning("Logo not found")
+            return None
+    
+    def _get_logo_dimensions(self, safe_width: float, logo_img: Optional[Image.Image]) -> tuple[float, float]:
         """Calculate logo dimensions."""
-        if not os.path.exists(self.config.assets.logo):
+        if logo_img is None:
             return (0, 0)
         
         try:
-            with Image.open(self.config.assets.logo) as logo_img:
-                logo_ratio = logo_img.height / logo_img.width
-                max_logo_width = safe_width * 0.20
-                logo_width = max_logo_width
-                logo_height = logo_width * logo_ratio
-                return (logo_width, logo_height)
+            logo_ratio = logo_img.height / logo_img.width
+            max_logo_width = safe_width * 0.20
+            logo_width = max_logo_width
+            logo_height = logo_width * logo_ratio
+            return (logo_width, logo_height)
         except Exception as e:
             logger.warning(f"Could not read logo dimensions: {e}")
             return (0, 0)
@@ -353,7 +338,6 @@ class BackwallLayout:
     def _draw_gradient_text_box(self, x: float, y: float, width: float, height: float, radius: float):
         """Draw semi-transparent box with gradient alpha and rounded corners."""
         from PIL import Image, ImageDraw, ImageChops
-        import tempfile
         
         dpi = 150
         box_width_px = int((width / mm) * (dpi / 25.4))
@@ -377,34 +361,20 @@ class BackwallLayout:
         mask_draw.rounded_rectangle([0, 0, box_width_px, box_height_px], radius=box_radius_px, fill=255)
         box_img.putalpha(ImageChops.multiply(box_img.split()[3], mask))
         
-        # Save and draw
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            tmp_path = tmp.name
-            box_img.save(tmp_path)
-        
-        try:
-            # Use CMYK-aware method (temp file is PNG/RGB, which is fine for text box)
-            self.canvas.draw_cmyk_image(tmp_path, x, y, width=width, height=height,
-                                       preserve_aspect=False, mask="auto")
-        finally:
-            try:
-                os.remove(tmp_path)
-            except:
-                pass
+        # Draw straight from memory (PNG/RGB is fine for the text box)
+        self.canvas.draw_cmyk_image(box_img, x, y, width=width, height=height,
+                                    preserve_aspect=False, mask="auto")
     
     def _draw_logo(self, center_x: float, baseline_y: float, width: float, height: float):
         """Draw logo centered at position."""
-        if not os.path.exists(self.config.assets.logo):
-            logger.warning("Logo not found")
-            return
-        
         try:
             logo_x = center_x - (width / 2)
             logo_y = baseline_y - height
 
-            # Use CMYK-aware method
+            # Reuse the cached, already downsampled logo reader across renders
+            logo_reader = load_image_reader(self.config.assets.logo, width, self._image_dpi())
             self.canvas.draw_cmyk_image(
-                self.config.assets.logo, logo_x, logo_y,
+                logo_reader, logo_x, logo_y,
                 width=width, height=height,
                 preserve_aspect=True,
                 mask="auto"
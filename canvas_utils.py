@@ -9,20 +9,98 @@ from reportlab.lib import colors
 from reportlab.lib.units import mm
 from reportlab.pdfgen import canvas
 from reportlab.pdfbase import pdfmetrics
+from reportlab.lib.utils import ImageReader
 from contextlib import contextmanager
+import functools
 import os
 import tempfile
 import logging
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Union
 from PIL import Image
 
 from color_management import CMYKColor, BRAND_COLORS_CMYK
+# Text fitting lives in graphics_common; re-exported for the layouts
+from graphics_common import fit_text_size, fit_multiline_font_size, unit_string_widths
 from graphics_config import GraphicsSpec, BackwallSpec, CounterSpec
 
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=16)
+def _load_image_cached(image_path: str, mtime_ns: int) -> Image.Image:
+    """Decode an image once per (path, modification time)."""
+    img = Image.open(image_path)
+    img.load()
+    return img
+
+
+def load_image(image_path: str) -> Image.Image:
+    """
+    Load a source asset, reusing the decoded image across renders.
+    
+    The returned image is shared between callers and must not be modified
+    in place; use ``.copy()`` or ``.convert()`` to derive a new image.
+    
+    Raises:
+        FileNotFoundError: If image_path does not exist
+    """
+    return _load_image_cached(image_path, os.stat(image_path).st_mtime_ns)
+
+
+def points_to_pixels(length: float, dpi: float) -> int:
+    """Convert a length in points to pixels at the given DPI."""
+    return int(round(length / 72.0 * dpi))
+
+
+def downsample_to_dpi(img: Image.Image, width: float, dpi: float) -> Image.Image:
+    """
+    Downsample an image so it is no denser than dpi when placed at width points.
+    
+    Images already at or below the target resolution are returned unchanged;
+    this never upsamples.
+    """
+    target_width = points_to_pixels(width, dpi)
+    if img.width <= target_width:
+        return img
+    target_height = max(1, round(img.height * target_width / img.width))
+    return img.resize((target_width, target_height), Image.Resampling.LANCZOS)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_image_reader_cached(image_path: str, mtime_ns: int,
+                              width: Optional[float], dpi: Optional[float]) -> ImageReader:
+    """Build an ImageReader once per (path, modification time, placement)."""
+    img = _load_image_cached(image_path, mtime_ns)
+    if width is not None and dpi is not None:
+        img = downsample_to_dpi(img, width, dpi)
+    reader = ImageReader(img)
+    # Populate the reader's RGB and alpha byte cache up front; drawImage
+    # hashes and embeds from it, so renders sharing this reader never
+    # convert the pixels again
+    reader.getRGBData()
+    return reader
+
+
+def load_image_reader(image_path: str, width: Optional[float] = None,
+                      dpi: Optional[float] = None) -> ImageReader:
+    """
+    Load a source asset as a ReportLab ImageReader, reused across renders.
+    
+    When width and dpi are given the image is first downsampled with
+    downsample_to_dpi, so the resize also happens only once.
+    
+    Args:
+        image_path: Path to image file
+        width: Placed width in points
+        dpi: Maximum effective resolution at that width
+    
+    Raises:
+        FileNotFoundError: If image_path does not exist
+    """
+    return _load_image_reader_cached(image_path, os.stat(image_path).st_mtime_ns, width, dpi)
+
+
 class CMYKCanvas:
     """
     Wrapper around ReportLab canvas that enforces CMYK color operations.
@@ -111,7 +189,33 @@ class CMYKCanvas:
         # Reset alpha
         self.canvas.setFillAlpha(1.0)
 
-    def draw_cmyk_image(self, image_path: str, x: float, y: float,
+    def draw_text_lines_cmyk(self, lines: List[Tuple[str, float, float]],
+                             font_name: str, font_size: float,
+                             color: CMYKColor, alpha: float = 1.0):
+        """
+        Draw several lines of text that share one style.
+
+        Fill color, alpha and font are set once for the whole batch rather
+        than per line, keeping the content stream free of repeated state
+        operators.
+
+        Args:
+            lines: (text, x, y) tuples
+            font_name: Font to draw with
+            font_size: Font size in points
+            color: CMYK text color
+            alpha: Opacity from 0.0 to 1.0
+        """
+        self.set_fill_color_cmyk(color, alpha)
+        self.canvas.setFont(font_name, font_size)
+
+        for text, x, y in lines:
+            self.canvas.drawString(x, y, text)
+
+        # Reset alpha
+        self.canvas.setFillAlpha(1.0)
+
+    def draw_cmyk_image(self, image: Union[str, Image.Image, ImageReader], x: float, y: float,
                         width: float, height: float,
                         preserve_aspect: bool = True,
                         mask: str = "auto"):
@@ -119,7 +223,8 @@ class CMYKCanvas:
         Draw an image preserving CMYK color mode.
 
         Args:
-            image_path: Path to image file
+            image: Path to image file, an already decoded PIL image, or an
+                ImageReader (drawn as-is)
             x, y: Position in points
             width, height: Size in points
             preserve_aspect: If True, maintain aspect ratio
@@ -130,7 +235,17 @@ class CMYKCanvas:
             avoiding ReportLab's ImageReader which converts to RGB.
         """
         try:
-            img = Image.open(image_path)
+            if isinstance(image, ImageReader):
+                self.canvas.drawImage(
+                    image, x, y,
+                    width=width,
+                    height=height,
+                    mask=mask,
+                    preserveAspectRatio=preserve_aspect
+                )
+                return
+
+            img = Image.open(image) if isinstance(image, str) else image
 
             # If image is CMYK and we want to preserve it
             if img.mode == 'CMYK' and self.use_cmyk:
@@ -142,9 +257,10 @@ class CMYKCanvas:
                     preserveAspectRatio=preserve_aspect
                 )
             else:
-                # Fallback to standard method for non-CMYK or proof mode
-                from reportlab.lib.utils import ImageReader
-                img_reader = ImageReader(image_path)
+                # Fallback to standard method for non-CMYK or proof mode.
+                # In-memory images are handed over directly to skip a
+                # temp-file round trip.
+                img_reader = ImageReader(image)
                 self.canvas.drawImage(
                     img_reader, x, y,
                     width=width,
@@ -153,7 +269,7 @@ class CMYKCanvas:
                     preserveAspectRatio=preserve_aspect
                 )
         except Exception as e:
-            logger.error(f"Failed to draw image {image_path}: {e}")
+            logger.error(f"Failed to draw image {image}: {e}")
             raise
 
     def __getattr__(self, name):
@@ -270,23 +386,23 @@ class ExhibitGraphicV2:
         mark_length = 10 * mm
         mark_offset = self.bleed
         
-        # Bottom-left
-        c.line(0, mark_offset, mark_length, mark_offset)
-        c.line(mark_offset, 0, mark_offset, mark_length)
-        
-        # Bottom-right
-        c.line(self.doc_width - mark_length, mark_offset, self.doc_width, mark_offset)
-        c.line(self.doc_width - mark_offset, 0, self.doc_width - mark_offset, mark_length)
-        
-        # Top-left
-        c.line(0, self.doc_height - mark_offset, mark_length, self.doc_height - mark_offset)
-        c.line(mark_offset, self.doc_height - mark_length, mark_offset, self.doc_height)
-        
-        # Top-right
-        c.line(self.doc_width - mark_length, self.doc_height - mark_offset,
-               self.doc_width, self.doc_height - mark_offset)
-        c.line(self.doc_width - mark_offset, self.doc_height - mark_length,
-               self.doc_width - mark_offset, self.doc_height)
+        # All eight marks go out as one path with a single stroke
+        c.lines([
+            # Bottom-left
+            (0, mark_offset, mark_length, mark_offset),
+            (mark_offset, 0, mark_offset, mark_length),
+            # Bottom-right
+            (self.doc_width - mark_length, mark_offset, self.doc_width, mark_offset),
+            (self.doc_width - mark_offset, 0, self.doc_width - mark_offset, mark_length),
+            # Top-left
+            (0, self.doc_height - mark_offset, mark_length, self.doc_height - mark_offset),
+            (mark_offset, self.doc_height - mark_length, mark_offset, self.doc_height),
+            # Top-right
+            (self.doc_width - mark_length, self.doc_height - mark_offset,
+             self.doc_width, self.doc_height - mark_offset),
+            (self.doc_width - mark_offset, self.doc_height - mark_length,
+             self.doc_width - mark_offset, self.doc_height),
+        ])
     
     def draw_guides(self, show_guides: bool = True):
         """Draw safe area and bleed guides (for reference, not in final)."""
@@ -366,34 +482,41 @@ class ExhibitGraphicV2:
         self.cleanup_temp_assets()
 
 
-def fit_text_size(text: str, font_name: str, max_width: float,
-                  starting_size: float = 220, minimum_size: float = 48) -> float:
+@functools.lru_cache(maxsize=8)
+def register_headline_font(font_path: str, preferred_font: str = "Ubuntu-Bold") -> str:
     """
-    Reduce font size until the string fits within max_width (points).
+    Register the headline TTF once per process and return the font to use.
+    
+    The result is memoized, so repeat lookups skip the registered-font scan
+    and the stat on font_path.
     
     Args:
-        text: Text to fit
-        font_name: Font name
-        max_width: Maximum width in points
-        starting_size: Starting font size
-        minimum_size: Minimum font size
+        font_path: Path to the TrueType font file
+        preferred_font: Name to register the font under
     
     Returns:
-        Font size that fits
+        preferred_font if it is (or could be) registered, else "Helvetica-Bold"
     """
-    font_size = starting_size
-    while font_size > minimum_size:
-        text_width = pdfmetrics.stringWidth(text, font_name, font_size)
-        if text_width <= max_width:
-            break
-        font_size -= 1
-    return font_size
+    from reportlab.pdfbase.ttfonts import TTFont
+    
+    if preferred_font in pdfmetrics.getRegisteredFontNames():
+        return preferred_font
+    
+    if os.path.exists(font_path):
+        try:
+            pdfmetrics.registerFont(TTFont(preferred_font, font_path))
+            return preferred_font
+        except Exception as e:
+            logger.warning(f"Could not register Ubuntu font: {e}. Using Helvetica-Bold.")
+    
+    return "Helvetica-Bold"
 
 
-def fit_multiline_font_size(lines: List[str], font_name: str, max_width: float,
-                            starting_size: float = 220, minimum_size: float = 48) -> float:
+def fit_multiline_text(lines: List[str], font_name: str, max_width: float,
+                       starting_size: float = 220,
+                       minimum_size: float = 48) -> Tuple[float, float]:
     """
-    Reduce font size until all lines fit within max_width.
+    Fit lines like fit_multiline_font_size and also report the widest line.
     
     Args:
         lines: List of text lines
@@ -403,15 +526,12 @@ def fit_multiline_font_size(lines: List[str], font_name: str, max_width: float,
         minimum_size: Minimum font size
     
     Returns:
-        Font size that fits all lines
+        (font_size, widest line width in points at that size)
     """
-    font_size = starting_size
-    while font_size > minimum_size:
-        widths = [pdfmetrics.stringWidth(line, font_name, font_size) for line in lines]
-        if max(widths) <= max_width:
-            break
-        font_size -= 1
-    return font_size
+    font_size = fit_multiline_font_size(lines, font_name, max_width,
+                                        starting_size=starting_size,
+                                        minimum_size=minimum_size)
+    return font_size, max(unit_string_widths(tuple(lines), font_name)) * font_size
 
 
 def draw_gradient_background(canvas_wrapper: CMYKCanvas, 
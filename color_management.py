@@ -284,7 +284,8 @@ def verify_cmyk_mode(image_path: str) -> bool:
 def apply_cmyk_vignette(image_path: str, output_path: str,
                         edge_fade: float = 0.25,
                         bottom_fade: float = 0.45,
-                        top_fade: float = 0.05) -> str:
+                        top_fade: float = 0.05,
+                        max_width_px: Optional[int] = None) -> str:
     """
     Apply vignette fade to a CMYK image while preserving CMYK mode.
 
@@ -294,6 +295,8 @@ def apply_cmyk_vignette(image_path: str, output_path: str,
         edge_fade: Percentage of width to fade on sides
         bottom_fade: Percentage of height to fade on bottom
         top_fade: Percentage of height to fade on top
+        max_width_px: If given, downsample wider sources to this width before
+            fading (never upsamples)
 
     Returns:
         Path to the output image
@@ -314,6 +317,11 @@ def apply_cmyk_vignette(image_path: str, output_path: str,
     # Ensure CMYK mode
     if img.mode != 'CMYK':
         img = img.convert('CMYK')
+
+    # Drop pixels beyond the output resolution before the per-pixel pass
+    if max_width_px and img.width > max_width_px:
+        target_height = max(1, round(img.height * max_width_px / img.width))
+        img = img.resize((max_width_px, target_height), Image.Resampling.LANCZOS)
     
     width, height = img.size
     
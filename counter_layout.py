@@ -12,11 +12,12 @@ from typing import Optional
 from reportlab.lib.units import mm
 from reportlab.lib.utils import ImageReader
 from reportlab.pdfbase import pdfmetrics
-from PIL import Image
 
 from graphics_config import GraphicsConfig
-from canvas_utils import ExhibitGraphicV2, CMYKCanvas
-from asset_pipeline import AssetPipeline, QRCodeConfig
+from canvas_utils import (
+    ExhibitGraphicV2, CMYKCanvas, load_image, load_image_reader, register_headline_font
+)
+from asset_pipeline import AssetPipeline, QRCodeConfig, create_radial_glow_image
 from color_management import BRAND_COLORS_CMYK, BRAND_COLORS_RGB
 
 
@@ -51,21 +52,7 @@ class CounterLayout:
     
     def _get_font_name(self) -> str:
         """Get headline font name, registering if needed."""
-        from reportlab.pdfbase.ttfonts import TTFont
-        
-        preferred_font = "Ubuntu-Bold"
-        if preferred_font in pdfmetrics.getRegisteredFontNames():
-            return preferred_font
-        
-        font_path = self.config.assets.ubuntu_bold_font
-        if os.path.exists(font_path):
-            try:
-                pdfmetrics.registerFont(TTFont(preferred_font, font_path))
-                return preferred_font
-            except Exception as e:
-                logger.warning(f"Could not register Ubuntu font: {e}. Using Helvetica-Bold.")
-        
-        return "Helvetica-Bold"
+        return register_headline_font(self.config.assets.ubuntu_bold_font)
     
     def _draw_background(self):
         """Draw background with radial gradient accents matching backwall."""
@@ -78,12 +65,7 @@ class CounterLayout:
         width_px = int(width_mm * (dpi / 25.4))
         height_px = int(height_mm * (dpi / 25.4))
         
-        # Create white background with teal gradient overlay
-        bg_img = Image.new("RGB", (width_px, height_px), (255, 255, 255))
-        overlay = Image.new("RGBA", (width_px, height_px), (0, 0, 0, 0))
-        
         # Teal gradient spots
-        teal_rgb = (90, 180, 190)
         gradient_spots = [
             {"x": 0.20, "y": 0.15, "radius": 0.40},
             {"x": 0.80, "y": 0.25, "radius": 0.35},
@@ -92,35 +74,26 @@ class CounterLayout:
             {"x": 0.50, "y": 0.88, "radius": 0.32},
         ]
         
-        for spot in gradient_spots:
-            cx = int(spot["x"] * width_px)
-            cy = int((1 - spot["y"]) * height_px)
-            max_radius = int(spot["radius"] * max(width_px, height_px))
-            
-            for y in range(max(0, cy - max_radius), min(height_px, cy + max_radius)):
-                for x in range(max(0, cx - max_radius), min(width_px, cx + max_radius)):
-                    dist = ((x - cx)**2 + (y - cy)**2) ** 0.5
-                    if dist < max_radius:
-                        alpha = int(60 * (1 - (dist / max_radius) ** 1.5))
-                        if alpha > 0:
-                            existing = overlay.getpixel((x, y))
-                            new_alpha = min(255, existing[3] + alpha)
-                            overlay.putpixel((x, y), (*teal_rgb, new_alpha))
+        # White background with teal gradient accents
+        bg_img = create_radial_glow_image(width_px, height_px, gradient_spots, color_rgb=(90, 180, 190))
         
-        bg_img.paste(overlay, (0, 0), overlay)
+        if not self.config.use_cmyk:
+            # RGB background can be embedded straight from memory
+            self.canvas.canvas.drawImage(
+                ImageReader(bg_img), 0, 0,
+                width=self.graphic.doc_width,
+                height=self.graphic.doc_height
+            )
+            return
         
-        # Save and draw
+        # Save and convert to CMYK
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
             tmp_path = tmp.name
             bg_img.save(tmp_path)
         
         try:
-            # Convert to CMYK if needed
-            if self.config.use_cmyk:
-                cmyk_path = self.asset_pipeline.ensure_cmyk_asset(tmp_path, "counter_bg.png")
-                bg_reader = ImageReader(cmyk_path)
-            else:
-                bg_reader = ImageReader(tmp_path)
+            cmyk_path = self.asset_pipeline.ensure_cmyk_asset(tmp_path, "counter_bg.png")
+            bg_reader = ImageReader(cmyk_path)
             
             self.canvas.canvas.drawImage(
                 bg_reader, 0, 0,
@@ -217,36 +190,38 @@ class CounterLayout:
     
     def _draw_logo(self):
         """Draw Skylar logo at bottom."""
-        if not os.path.exists(self.config.assets.logo):
+        try:
+            logo_img = load_image(self.config.assets.logo)
+        except FileNotFoundError:
             logger.warning("Logo not found")
             return
         
         logger.info("Drawing logo")
         
         try:
-            with Image.open(self.config.assets.logo) as logo_img:
-                logo_ratio = logo_img.height / logo_img.width
-                
-                # Calculate dimensions
-                safe_origin_x = self.graphic.bleed + self.graphic.safe_inset
-                safe_origin_y = self.graphic.bleed + self.graphic.safe_inset
-                safe_width = self.graphic.trim_width - (2 * self.graphic.safe_inset)
-                
-                max_logo_width = safe_width * 0.55
-                logo_width = max_logo_width
-                logo_height = logo_width * logo_ratio
-                
-                # Position at bottom
-                logo_x = (self.graphic.doc_width - logo_width) / 2
-                logo_y = safe_origin_y + (40 * mm)
-                
-                # Draw
-                logo_reader = ImageReader(self.config.assets.logo)
-                self.canvas.canvas.drawImage(
-                    logo_reader, logo_x, logo_y,
-                    width=logo_width, height=logo_height,
-                    mask="auto", preserveAspectRatio=True
-                )
+            logo_ratio = logo_img.height / logo_img.width
+            
+            # Calculate dimensions
+            safe_origin_x = self.graphic.bleed + self.graphic.safe_inset
+            safe_origin_y = self.graphic.bleed + self.graphic.safe_inset
+            safe_width = self.graphic.trim_width - (2 * self.graphic.safe_inset)
+            
+            max_logo_width = safe_width * 0.55
+            logo_width = max_logo_width
+            logo_height = logo_width * logo_ratio
+            
+            # Position at bottom
+            logo_x = (self.graphic.doc_width - logo_width) / 2
+            logo_y = safe_origin_y + (40 * mm)
+            
+            # Draw from the cached logo reader, capped at the preferred DPI
+            dpi = self.config.spec.print_spec.preferred_effective_dpi
+            logo_reader = load_image_reader(self.config.assets.logo, logo_width, dpi)
+            self.canvas.canvas.drawImage(
+                logo_reader, logo_x, logo_y,
+                width=logo_width, height=logo_height,
+                mask="auto", preserveAspectRatio=True
+            )
         except Exception as e:
             logger.error(f"Could not render logo: {e}")
     
@@ -0,0 +1,63 @@
+"""
+Unified Graphics Generator
+Creates the backwall and counter graphics in one run.
+
+The two deliverables are independent, so they are generated in separate
+processes and run concurrently.
+"""
+
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+from backwall_generator import create_backwall
+from counter_generator import create_counter
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def generate_all_graphics(output_dir="output", show_guides=False, generate_proof=True):
+    """
+    Create the backwall and counter graphics in parallel.
+
+    Args:
+        output_dir: Directory to save output files
+        show_guides: Whether to show guide lines (safe area, no-text zone)
+        generate_proof: Generate JPG proofs (default: True)
+
+    Returns:
+        (backwall_pdf, counter_pdf) paths
+    """
+    logger.info("Generating backwall and counter...")
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        backwall_future = executor.submit(
+            create_backwall, output_dir=output_dir, show_guides=show_guides,
+            generate_proof=generate_proof
+        )
+        counter_future = executor.submit(
+            create_counter, output_dir=output_dir, show_guides=show_guides,
+            generate_proof=generate_proof
+        )
+        return backwall_future.result(), counter_future.result()
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("EXHIBIT GRAPHICS GENERATOR")
+    print("="*60 + "\n")
+
+    # Generate both deliverables without guides (production-ready)
+    backwall_pdf, counter_pdf = generate_all_graphics(output_dir="output", show_guides=False)
+
+    # For review with guides visible, use:
+    # generate_all_graphics(output_dir="output", show_guides=True)
+
+    print("\n" + "-"*60)
+    print("✓ Graphics generated successfully!")
+    print(f"✓ Backwall: {backwall_pdf}")
+    print(f"✓ Counter: {counter_pdf}")
+    print(f"✓ Output directory: {os.path.abspath('output')}")
+    print("-"*60 + "\n")
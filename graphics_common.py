@@ -7,7 +7,8 @@ from reportlab.lib.units import mm
 from reportlab.pdfgen import canvas
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
-from PIL import Image
+import functools
+import math
 import os
 
 
@@ -37,6 +38,24 @@ SPECS = {
 }
 
 
+def _spec_in_points(specs):
+    """Convert one graphic's SPECS entry from mm to points."""
+
+    spec_pt = {
+        "trim_width": specs["trim"]["width"] * mm,
+        "trim_height": specs["trim"]["height"] * mm,
+        "bleed": specs["bleed"]["all_sides"] * mm,
+        "safe_inset": specs["safe_inset"] * mm,
+    }
+    if "no_text_zone" in specs:
+        spec_pt["no_text_zone"] = {key: value * mm for key, value in specs["no_text_zone"].items()}
+    return spec_pt
+
+
+# Graphic dimensions from SPECS, converted to points once at import
+SPECS_PT = {name: _spec_in_points(SPECS[name]) for name in ("backwall", "counter")}
+
+
 BRAND_COLORS = {
     "background": colors.HexColor("#F8FAFC"),
     "headline_text": colors.HexColor("#0E2E3E"),
@@ -54,8 +73,12 @@ EYES_IMAGE_PATH = os.path.join(BASE_DIR, "assets", "19842217-02bc-47dd-96cf-cd23
 UBUNTU_BOLD_PATH = os.path.join(BASE_DIR, "assets", "fonts", "Ubuntu-Bold.ttf")
 
 
+@functools.lru_cache(maxsize=1)
 def get_headline_font_name():
-    """Register Ubuntu Bold if available and return the preferred font name."""
+    """Register Ubuntu Bold if available and return the preferred font name.
+
+    Memoized: the registration check and font-file stat run once per process.
+    """
 
     preferred_font = "Ubuntu-Bold"
     if preferred_font in pdfmetrics.getRegisteredFontNames():
@@ -71,28 +94,60 @@ def get_headline_font_name():
     return "Helvetica-Bold"
 
 
+@functools.lru_cache(maxsize=256)
+def unit_string_widths(lines, font_name):
+    """Width of each line at 1pt; widths at other sizes scale linearly.
+
+    lines must be a tuple so the result can be memoized.
+    """
+
+    return tuple(pdfmetrics.stringWidth(line, font_name, 1) for line in lines)
+
+
 def fit_text_size(text, font_name, max_width, starting_size=220, minimum_size=48):
     """Reduce font size until the string fits within max_width (points)."""
 
-    font_size = starting_size
-    while font_size > minimum_size:
-        text_width = pdfmetrics.stringWidth(text, font_name, font_size)
-        if text_width <= max_width:
-            break
-        font_size -= 1
-    return font_size
+    return fit_multiline_font_size([text], font_name, max_width, starting_size, minimum_size)
 
 
 def fit_multiline_font_size(lines, font_name, max_width, starting_size=220, minimum_size=48):
-    """Reduce font size until all lines fit within max_width."""
+    """Reduce font size until all lines fit within max_width.
+
+    String width is linear in font size, so measure once and solve for the size.
+    Results are memoized per (lines, font, limits).
+    """
+
+    return _fit_multiline_font_size(tuple(lines), font_name, max_width, starting_size, minimum_size)
+
+
+@functools.lru_cache(maxsize=128)
+def _fit_multiline_font_size(lines, font_name, max_width, starting_size, minimum_size):
+    """Cached body of fit_multiline_font_size; lines must be a tuple."""
+
+    if starting_size <= minimum_size:
+        return starting_size
+
+    widest = max(unit_string_widths(lines, font_name))
+    if widest <= 0:
+        return starting_size
+
+    fitting_size = max_width / widest
+    if fitting_size >= starting_size:
+        return starting_size
+
+    # Step down from starting_size in whole points, as the original loop did
+    font_size = starting_size - math.ceil(starting_size - fitting_size)
+
+    # The division can round either way at an exact fit; settle the last
+    # point with the same measurement the step-down loop would have used
+    def too_wide(size):
+        return max(pdfmetrics.stringWidth(line, font_name, size) for line in lines) > max_width
 
-    font_size = starting_size
-    while font_size > minimum_size:
-        widths = [pdfmetrics.stringWidth(line, font_name, font_size) for line in lines]
-        if max(widths) <= max_width:
-            break
+    if font_size < starting_size and not too_wide(font_size + 1):
+        font_size += 1
+    elif font_size > minimum_size and too_wide(font_size):
         font_size -= 1
-    return font_size
+    return max(font_size, minimum_size)
 
 
 def create_bottom_fade_image(image_path, fade_percentage=0.35):
@@ -107,6 +162,8 @@ def create_bottom_fade_image(image_path, fade_percentage=0.35):
     Returns:
         PIL Image with bottom fade applied
     """
+    from PIL import Image  # Only needed for the fade helpers, so imported lazily
+
     img = Image.open(image_path).convert("RGBA")
     width, height = img.size
 
@@ -146,6 +203,8 @@ def create_vignette_fade_image(image_path, edge_fade=0.25, bottom_fade=0.45, top
     Returns:
         PIL Image with vignette fade applied
     """
+    from PIL import Image  # Only needed for the fade helpers, so imported lazily
+
     img = Image.open(image_path).convert("RGBA")
     width, height = img.size
 
@@ -211,39 +270,78 @@ def draw_centered_string(canvas_obj, text, font_name, font_size, center_x, basel
     canvas_obj.setFillAlpha(1.0)  # Reset to opaque for other elements
 
 
+def _render_proof_with_pymupdf(pdf_path, jpg_path, max_width):
+    """Rasterize the first PDF page in-process with PyMuPDF and save it as JPEG.
+
+    Returns:
+        False if PyMuPDF is not installed, True once the proof is written.
+    """
+    try:
+        import pymupdf
+    except ImportError:
+        return False
+
+    with pymupdf.open(pdf_path) as doc:
+        page = doc[0]
+        zoom = max_width / page.rect.width
+        pix = page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom), alpha=False)
+        pix.save(jpg_path, jpg_quality=85)
+    return True
+
+
 def create_jpg_proof(pdf_path, output_dir, jpg_filename, max_width=1200):
     """
     Create a JPG proof from PDF for quick review
 
+    Uses PyMuPDF when installed (no subprocess), falling back to pdf2image
+    and poppler when it is missing or fails.
+
     Args:
         pdf_path: Path to the PDF file
         output_dir: Directory to save JPG
         jpg_filename: Name of the JPG file
         max_width: Maximum width of the JPG proof in pixels
     """
-    try:
-        from pdf2image import convert_from_path
+    jpg_path = os.path.join(output_dir, jpg_filename)
 
-        # Convert PDF to image
-        images = convert_from_path(pdf_path, dpi=150)
+    try:
+        if _render_proof_with_pymupdf(pdf_path, jpg_path, max_width):
+            print(f"✓ Created proof: {jpg_path}")
+            return
+    except Exception as e:
+        # poppler may still cope with a file MuPDF rejects
+        print(f"⚠ PyMuPDF could not render the proof ({e}); trying pdf2image")
 
-        if images:
-            img = images[0]
+    try:
+        from pdf2image import convert_from_path
 
-            # Resize for proof
-            aspect_ratio = img.height / img.width
-            new_width = max_width
-            new_height = int(new_width * aspect_ratio)
-            img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # Render only the first page, letting poppler scale to the proof
+        # width and write the JPEG itself, so the image never passes
+        # through Python for a resize or re-encode
+        paths = convert_from_path(
+            pdf_path,
+            dpi=150,
+            first_page=1,
+            last_page=1,
+            fmt="jpeg",
+            jpegopt={"quality": 85, "progressive": False, "optimize": False},
+            thread_count=2,
+            size=(max_width, None),
+            output_folder=output_dir,
+            output_file=os.path.splitext(jpg_filename)[0],
+            single_file=True,
+            paths_only=True,
+        )
 
-            # Save as JPG
-            jpg_path = os.path.join(output_dir, jpg_filename)
-            img_resized.save(jpg_path, "JPEG", quality=85)
+        if paths:
+            # poppler always names the file <output_file>.jpg
+            if os.path.abspath(paths[0]) != os.path.abspath(jpg_path):
+                os.replace(paths[0], jpg_path)
             print(f"✓ Created proof: {jpg_path}")
     except ImportError:
-        print("⚠ pdf2image not installed. Skipping JPG proof generation.")
-        print("  Install with: pip install pdf2image")
-        print("  Also requires poppler: brew install poppler (macOS) or apt-get install poppler-utils (Linux)")
+        print("⚠ Neither PyMuPDF nor pdf2image is installed. Skipping JPG proof generation.")
+        print("  Install with: pip install PyMuPDF (or pip install pdf2image)")
+        print("  pdf2image also requires poppler: brew install poppler (macOS) or apt-get install poppler-utils (Linux)")
     except Exception as e:
         print(f"⚠ Could not create JPG proof: {e}")
 
@@ -251,22 +349,22 @@ def create_jpg_proof(pdf_path, output_dir, jpg_filename, max_width=1200):
 class ExhibitGraphic:
     """Base class for creating exhibit graphics"""
 
-    def __init__(self, name, trim_width, trim_height, bleed=5, safe_inset=50):
+    def __init__(self, name, trim_width, trim_height, bleed=5 * mm, safe_inset=50 * mm):
         """
         Initialize graphic specifications
 
         Args:
             name: Name of the graphic (e.g., 'backwall', 'counter')
-            trim_width: Width at trim size in mm
-            trim_height: Height at trim size in mm
-            bleed: Bleed size in mm (default 5)
-            safe_inset: Safe area inset in mm (default 50)
+            trim_width: Width at trim size in points
+            trim_height: Height at trim size in points
+            bleed: Bleed size in points (default 5mm)
+            safe_inset: Safe area inset in points (default 50mm)
         """
         self.name = name
-        self.trim_width = trim_width * mm
-        self.trim_height = trim_height * mm
-        self.bleed = bleed * mm
-        self.safe_inset = safe_inset * mm
+        self.trim_width = trim_width
+        self.trim_height = trim_height
+        self.bleed = bleed
+        self.safe_inset = safe_inset
 
         # Document size includes bleed
         self.doc_width = self.trim_width + (2 * self.bleed)
@@ -291,23 +389,23 @@ class ExhibitGraphic:
         mark_length = 10 * mm
         mark_offset = self.bleed
 
-        # Bottom-left
-        c.line(0, mark_offset, mark_length, mark_offset)
-        c.line(mark_offset, 0, mark_offset, mark_length)
-
-        # Bottom-right
-        c.line(self.doc_width - mark_length, mark_offset, self.doc_width, mark_offset)
-        c.line(self.doc_width - mark_offset, 0, self.doc_width - mark_offset, mark_length)
-
-        # Top-left
-        c.line(0, self.doc_height - mark_offset, mark_length, self.doc_height - mark_offset)
-        c.line(mark_offset, self.doc_height - mark_length, mark_offset, self.doc_height)
-
-        # Top-right
-        c.line(self.doc_width - mark_length, self.doc_height - mark_offset,
-               self.doc_width, self.doc_height - mark_offset)
-        c.line(self.doc_width - mark_offset, self.doc_height - mark_length,
-               self.doc_width - mark_offset, self.doc_height)
+        # All eight marks go out as one path with a single stroke
+        c.lines([
+            # Bottom-left
+            (0, mark_offset, mark_length, mark_offset),
+            (mark_offset, 0, mark_offset, mark_length),
+            # Bottom-right
+            (self.doc_width - mark_length, mark_offset, self.doc_width, mark_offset),
+            (self.doc_width - mark_offset, 0, self.doc_width - mark_offset, mark_length),
+            # Top-left
+            (0, self.doc_height - mark_offset, mark_length, self.doc_height - mark_offset),
+            (mark_offset, self.doc_height - mark_length, mark_offset, self.doc_height),
+            # Top-right
+            (self.doc_width - mark_length, self.doc_height - mark_offset,
+             self.doc_width, self.doc_height - mark_offset),
+            (self.doc_width - mark_offset, self.doc_height - mark_length,
+             self.doc_width - mark_offset, self.doc_height),
+        ])
 
     def draw_guides(self, show_guides=True):
         """Draw safe area and bleed guides (for reference, not in final)"""
@@ -352,23 +450,17 @@ class BackwallGraphic(ExhibitGraphic):
     """Backwall graphic with no-text zone"""
 
     def __init__(self):
-        specs = SPECS["backwall"]
+        specs = SPECS_PT["backwall"]
         super().__init__(
             "backwall",
-            specs["trim"]["width"],
-            specs["trim"]["height"],
-            specs["bleed"]["all_sides"],
+            specs["trim_width"],
+            specs["trim_height"],
+            specs["bleed"],
             specs["safe_inset"]
         )
 
         # No-text zone (bottom-right corner, in trim coordinates)
-        ntz = specs["no_text_zone"]
-        self.no_text_zone = {
-            "x": ntz["x"] * mm,
-            "y": ntz["y"] * mm,
-            "width": ntz["width"] * mm,
-            "height": ntz["height"] * mm
-        }
+        self.no_text_zone = dict(specs["no_text_zone"])
 
     def draw_no_text_zone_guide(self, show_guides=True):
         """Draw no-text zone indicator"""
@@ -395,11 +487,11 @@ class CounterGraphic(ExhibitGraphic):
     """Counter graphic"""
 
     def __init__(self):
-        specs = SPECS["counter"]
+        specs = SPECS_PT["counter"]
         super().__init__(
             "counter",
-            specs["trim"]["width"],
-            specs["trim"]["height"],
-            specs["bleed"]["all_sides"],
+            specs["trim_width"],
+            specs["trim_height"],
+            specs["bleed"],
             specs["safe_inset"]
         )
@@ -7,8 +7,11 @@ Verifies that PDFs and intermediate assets use CMYK color mode.
 
 import os
 import sys
-from PIL import Image
-from pathlib import Path
+
+
+# Formats that can store CMYK pixel data; anything else (e.g. PNG) cannot be CMYK
+CMYK_CAPABLE_EXTENSIONS = {'.tif', '.tiff', '.jpg', '.jpeg'}
+IMAGE_EXTENSIONS = CMYK_CAPABLE_EXTENSIONS | {'.png'}
 
 
 def verify_image_cmyk(image_path: str) -> tuple[bool, str]:
@@ -18,10 +21,17 @@ def verify_image_cmyk(image_path: str) -> tuple[bool, str]:
     Returns:
         (is_cmyk, details)
     """
+    ext = os.path.splitext(image_path)[1].lower()
+    if ext not in CMYK_CAPABLE_EXTENSIONS:
+        return False, f"✗ {ext.lstrip('.').upper() or 'Unknown'} format cannot store CMYK"
+
     try:
-        img = Image.open(image_path)
-        mode = img.mode
-        size = img.size
+        from PIL import Image
+
+        # Only the header is read; mode and size don't need a pixel decode
+        with Image.open(image_path) as img:
+            mode = img.mode
+            size = img.size
 
         if mode == 'CMYK':
             return True, f"✓ CMYK mode, size: {size[0]}x{size[1]}"
@@ -31,43 +41,74 @@ def verify_image_cmyk(image_path: str) -> tuple[bool, str]:
         return False, f"✗ Error: {e}"
 
 
+def _image_colorspace(pdf_doc, xref: int) -> tuple[str, bool]:
+    """
+    Read an image XObject's /ColorSpace entry without decoding its stream.
+
+    Returns:
+        (colorspace name, is_cmyk)
+    """
+    kind, value = pdf_doc.xref_get_key(xref, "ColorSpace")
+    if kind == "xref":
+        value = pdf_doc.xref_object(int(value.split()[0]), compressed=True)
+    elif kind == "null":
+        return "unknown", False
+
+    tokens = value.replace("[", " ").replace("]", " ").split()
+    if not tokens:
+        return "unknown", False
+
+    name = tokens[0].lstrip("/")
+    if name == "ICCBased" and len(tokens) > 1:
+        # ICC profiles declare their component count; 4 means CMYK
+        components = pdf_doc.xref_get_key(int(tokens[1]), "N")[1]
+        return f"ICCBased (N={components})", components == "4"
+
+    return name, name == "DeviceCMYK"
+
+
 def verify_pdf_images(pdf_path: str) -> tuple[bool, list[str]]:
     """
-    Extract and verify images from PDF using reportlab.
+    Verify the color space of every image in a PDF using PyMuPDF.
 
     Returns:
         (all_cmyk, details)
     """
     try:
-        from reportlab.pdfgen import canvas
-        from reportlab.lib.utils import ImageReader
-        import fitz  # PyMuPDF
+        import pymupdf
 
         details = []
-        pdf_doc = fitz.open(pdf_path)
+        pdf_doc = pymupdf.open(pdf_path)
 
         all_cmyk = True
         image_count = 0
 
-        for page_num, page in enumerate(pdf_doc, 1):
-            image_list = page.get_images(full=True)
+        # Walk the xref table once; each image object appears exactly once
+        # however many pages use it
+        image_xrefs = []
+        soft_mask_xrefs = set()
+        for xref in range(1, pdf_doc.xref_length()):
+            if pdf_doc.xref_get_key(xref, "Subtype") != ("name", "/Image"):
+                continue
+            image_xrefs.append(xref)
 
-            for img_index, img_info in enumerate(image_list):
-                image_count += 1
-                xref = img_info[0]
+            kind, value = pdf_doc.xref_get_key(xref, "SMask")
+            if kind == "xref":
+                soft_mask_xrefs.add(int(value.split()[0]))
 
-                # Extract image
-                base_image = pdf_doc.extract_image(xref)
-                image_bytes = base_image["image"]
-                image_ext = base_image["ext"]
-                colorspace = base_image.get("colorspace", "unknown")
+        for xref in image_xrefs:
+            if xref in soft_mask_xrefs:
+                continue  # Soft masks carry transparency, not color
+            image_count += 1
 
-                # Try to determine color space
-                if colorspace in [8, "DeviceCMYK", "/DeviceCMYK"]:
-                    details.append(f"  Image {image_count} (page {page_num}): ✓ CMYK")
-                else:
-                    details.append(f"  Image {image_count} (page {page_num}): ✗ {colorspace} (not CMYK)")
-                    all_cmyk = False
+            # Read the color space from the image dictionary only
+            colorspace, is_cmyk = _image_colorspace(pdf_doc, xref)
+
+            if is_cmyk:
+                details.append(f"  Image {image_count} (xref {xref}): ✓ CMYK")
+            else:
+                details.append(f"  Image {image_count} (xref {xref}): ✗ {colorspace} (not CMYK)")
+                all_cmyk = False
 
         pdf_doc.close()
 
@@ -77,7 +118,7 @@ def verify_pdf_images(pdf_path: str) -> tuple[bool, list[str]]:
         return all_cmyk, details
 
     except ImportError:
-        return None, ["  ⚠ PyMuPDF (fitz) not installed. Install with: pip install PyMuPDF"]
+        return None, ["  ⚠ PyMuPDF not installed. Install with: pip install PyMuPDF"]
     except Exception as e:
         return None, [f"  ✗ Error analyzing PDF: {e}"]
 
@@ -96,17 +137,18 @@ def verify_temp_assets(temp_dir: str = "output/temp") -> tuple[int, int, list[st
     cmyk_count = 0
     total_count = 0
 
-    # Check common image formats
-    for ext in ['*.tif', '*.tiff', '*.png', '*.jpg', '*.jpeg']:
-        for img_path in Path(temp_dir).glob(ext):
+    # Check common image formats in a single directory pass
+    with os.scandir(temp_dir) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if not entry.is_file() or os.path.splitext(entry.name)[1].lower() not in IMAGE_EXTENSIONS:
+                continue
+
             total_count += 1
-            is_cmyk, msg = verify_image_cmyk(str(img_path))
+            is_cmyk, msg = verify_image_cmyk(entry.path)
 
             if is_cmyk:
                 cmyk_count += 1
-                details.append(f"  {img_path.name}: {msg}")
-            else:
-                details.append(f"  {img_path.name}: {msg}")
+            details.append(f"  {entry.name}: {msg}")
 
     return cmyk_count, total_count, details
 
@@ -2,200 +2,326 @@
 """
 Pre-flight verification script for print-ready PDFs.
 Checks compliance with requirements.md specifications.
+
+Set VERIFY_QUIET=1 to omit the manual checklist from the report.
+
+Reports are cached in ~/.cache/verify_print_ready keyed by the PDF's MD5, so
+re-running on an unchanged file is instant. Set VERIFY_NO_CACHE=1 to bypass it.
 """
 
+import os
 import sys
+import hashlib
+import json
+import multiprocessing
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 try:
-    import PyPDF2
-    import pdfplumber
+    import pikepdf
     from PIL import Image
 except ImportError:
     print("⚠️  Missing dependencies. Install with:")
-    print("   pip install PyPDF2 pdfplumber Pillow")
+    print("   pip install pikepdf Pillow")
     sys.exit(1)
 
+try:
+    import pymupdf  # Faster text/image inspection than walking content streams
+except ImportError:
+    pymupdf = None
+
+
+# Expected page size (trim + 2 × 5mm bleed) for each deliverable, keyed by
+# the token that appears in its filename
+SIZE_SPECS = {
+    "Backwall": ((1000 + 10, 2170 + 10), "backwall spec (100×217cm + 5mm bleed)"),
+    "Counter": ((300 + 10, 800 + 10), "counter spec (30×80cm + 5mm bleed)"),
+}
+SIZE_TOLERANCE_MM = 5
+_PT_TO_MM = 25.4 / 72
+_SPEC_RE = re.compile("(" + "|".join(SIZE_SPECS) + ")")
+
+# Bump whenever a change to the checks would alter a cached report
+_CACHE_VERSION = 2
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "verify_print_ready"
+
+# Outlined PRINT_READY exports below this size skip the image scan
+IMAGE_CHECK_SKIP_MAX_BYTES = 50_000_000
+
+# Summary-row prefixes, padded to line the check names up
+_STATUS = {
+    True: "✅ PASS       ",
+    False: "❌ FAIL       ",
+    None: "⚠️  MANUAL   ",
+}
+
+CHECK_ORDER = (
+    "File Integrity", "PDF Metadata", "Text Outlined",
+    "Fonts Embedded", "Images Embedded", "Color Space",
+)
+
+
+# Report lines are collected here and handed back in one piece by _take_report()
+_OUT = []
+# Checks running on a worker thread queue into their own list instead
+_local = threading.local()
+
+
+def _out(line=""):
+    """Queue one line of report output."""
+    getattr(_local, "out", _OUT).append(line)
+
+
+def _out_error(line):
+    """Queue a line reporting that a check could not run.
+
+    The cause may be transient, so a report containing one is not cached.
+    """
+    _local.errored = True
+    _out(line)
+
+
+def _take_report():
+    """Return all queued report output as one string and reset the queue."""
+    report = "\n".join(_OUT) + "\n" if _OUT else ""
+    _OUT.clear()
+    return report
 
-def check_text_outlined(pdf_path):
+
+def _open_content_doc(pdf_path):
+    """Open the document the text and image checks read from.
+
+    PyMuPDF when installed, otherwise a second pikepdf handle: the main
+    reader belongs to the structure-check thread and qpdf handles are not
+    thread-safe.
+    """
+    if pymupdf is not None:
+        return pymupdf.open(str(pdf_path))
+    return pikepdf.open(pdf_path)
+
+
+def _iter_pages(pdf):
+    """Yield the leaf page dictionaries in order, walking /Kids lazily.
+
+    Unlike pdf.pages, this never flattens the whole page tree, so a caller
+    that stops early only touches the branches it needs.
+
+    Raises:
+        ValueError: if the page tree contains a cycle
+    """
+    seen = set()
+    stack = [pdf.Root.Pages]
+    while stack:
+        node = stack.pop()
+        if node.is_indirect:
+            if node.objgen in seen:
+                raise ValueError("page tree contains a cycle")
+            seen.add(node.objgen)
+        if node.get('/Type') == '/Pages':
+            stack.extend(reversed(list(node.get('/Kids', []))))
+        else:
+            yield node
+
+
+def _first_page(pdf):
+    """Return the first page without flattening the page tree.
+
+    Raises:
+        ValueError: if the PDF has no pages or its page tree is cyclic
+    """
+    node = next(_iter_pages(pdf), None)
+    if node is None:
+        raise ValueError("PDF has no pages")
+    return pikepdf.Page(node)
+
+
+def _page_text(page):
+    """Collect the strings shown by text operators in a page's content stream."""
+    chunks = []
+    for operands, operator in pikepdf.parse_content_stream(page, "Tj TJ ' \""):
+        if str(operator) == "TJ":
+            chunks.extend(bytes(item).decode("latin-1") for item in operands[0] if isinstance(item, pikepdf.String))
+        else:
+            chunks.append(bytes(operands[-1]).decode("latin-1"))
+    return "".join(chunks)
+
+
+def _page_images(page):
+    """List (width, height) of the image XObjects in a page's resources."""
+    resources = page.get('/Resources')
+    xobjects = resources.get('/XObject') if resources is not None else None
+    if not xobjects:
+        return []
+    return [
+        (int(xobj.get('/Width', 0)), int(xobj.get('/Height', 0)))
+        for _, xobj in sorted(xobjects.items())
+        if xobj.get('/Subtype') == '/Image'
+    ]
+
+
+def check_text_outlined(doc):
     """Verify text has been converted to paths (not extractable)."""
-    print("\n📝 Checking text conversion...")
+    _out("\n📝 Checking text conversion...")
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            text = pdf.pages[0].extract_text() or ''
-            text_length = len(text.strip())
-            
-            if text_length == 0:
-                print("   ✅ Text converted to paths (no extractable text)")
-                return True
-            else:
-                print(f"   ❌ FAIL: Found {text_length} characters of extractable text")
-                print(f"   Sample: {text[:100]}")
-                return False
+        if pymupdf is not None:
+            text = doc[0].get_text("text")
+        else:
+            text = _page_text(_first_page(doc))
+        text = text.strip()
+        text_length = len(text)
+        
+        if text_length == 0:
+            _out("   ✅ Text converted to paths (no extractable text)")
+            return True
+        else:
+            _out(f"   ❌ FAIL: Found {text_length} characters of extractable text")
+            _out(f"   Sample: {text[:100]}")
+            return False
     except Exception as e:
-        print(f"   ⚠️  Could not verify text: {e}")
+        _out_error(f"   ⚠️  Could not verify text: {e}")
         return None
 
 
-def check_fonts_embedded(pdf_path):
+def check_fonts_embedded(reader, page0, pdf_path):
     """Check if any fonts are still embedded (should be none after outlining)."""
-    print("\n🔤 Checking font embedding...")
+    _out("\n🔤 Checking font embedding...")
     try:
-        with open(pdf_path, 'rb') as f:
-            pdf = PyPDF2.PdfReader(f)
-            
-            # Check for font references in the PDF
-            fonts_found = []
-            for page in pdf.pages:
-                if '/Font' in page.get('/Resources', {}):
-                    fonts = page['/Resources']['/Font']
-                    fonts_found.extend(fonts.keys())
-            
-            if not fonts_found:
-                print("   ✅ No fonts embedded (text properly outlined)")
-                return True
-            else:
-                print(f"   ⚠️  Found font references: {fonts_found}")
-                print("   (May be acceptable if text is still outlined)")
-                return None
+        # Check for font references in the PDF
+        fonts_found = []
+        for page in _iter_pages(reader):
+            resources = page.get('/Resources')
+            if resources is None:
+                continue
+            fonts = resources.get('/Font')
+            if fonts:
+                fonts_found.extend(sorted(fonts.keys()))
+        
+        if not fonts_found:
+            _out("   ✅ No fonts embedded (text properly outlined)")
+            return True
+        else:
+            _out(f"   ⚠️  Found font references: {fonts_found}")
+            _out("   (May be acceptable if text is still outlined)")
+            return None
     except Exception as e:
-        print(f"   ⚠️  Could not check fonts: {e}")
+        _out_error(f"   ⚠️  Could not check fonts: {e}")
         return None
 
 
-def check_pdf_metadata(pdf_path):
+def check_pdf_metadata(reader, page0, pdf_path):
     """Extract and display PDF metadata."""
-    print("\n📋 PDF Metadata:")
+    _out("\n📋 PDF Metadata:")
     try:
-        with open(pdf_path, 'rb') as f:
-            pdf = PyPDF2.PdfReader(f)
-            
-            # Page count
-            print(f"   Pages: {len(pdf.pages)}")
-            
-            # Page size (in points, 1 point = 1/72 inch)
-            page = pdf.pages[0]
-            box = page.mediabox
-            width_pt = float(box.width)
-            height_pt = float(box.height)
-            width_mm = width_pt * 25.4 / 72
-            height_mm = height_pt * 25.4 / 72
-            
-            print(f"   Page size: {width_mm:.1f} × {height_mm:.1f} mm")
-            print(f"              ({width_pt:.1f} × {height_pt:.1f} pt)")
-            
-            # Check if size matches expected dimensions
-            if "Backwall" in str(pdf_path):
-                expected = (1000 + 10, 2170 + 10)  # 100cm + bleed
-                tolerance = 5
-                if abs(width_mm - expected[0]) < tolerance and abs(height_mm - expected[1]) < tolerance:
-                    print(f"   ✅ Dimensions match backwall spec (100×217cm + 5mm bleed)")
-                else:
-                    print(f"   ⚠️  Expected ~{expected[0]}×{expected[1]}mm")
-            elif "Counter" in str(pdf_path):
-                expected = (300 + 10, 800 + 10)  # 30cm + bleed
-                tolerance = 5
-                if abs(width_mm - expected[0]) < tolerance and abs(height_mm - expected[1]) < tolerance:
-                    print(f"   ✅ Dimensions match counter spec (30×80cm + 5mm bleed)")
-                else:
-                    print(f"   ⚠️  Expected ~{expected[0]}×{expected[1]}mm")
-            
-            # Metadata
-            if pdf.metadata:
-                print(f"   Creator: {pdf.metadata.get('/Creator', 'N/A')}")
-                print(f"   Producer: {pdf.metadata.get('/Producer', 'N/A')}")
-            
-            return True
+        # Page count
+        _out(f"   Pages: {int(reader.Root.Pages.Count)}")
+        
+        # Page size (in points, 1 point = 1/72 inch)
+        x0, y0, x1, y1 = (float(v) for v in page0.mediabox)
+        width_pt = x1 - x0
+        height_pt = y1 - y0
+        width_mm = width_pt * _PT_TO_MM
+        height_mm = height_pt * _PT_TO_MM
+        
+        _out(f"   Page size: {width_mm:.1f} × {height_mm:.1f} mm")
+        _out(f"              ({width_pt:.1f} × {height_pt:.1f} pt)")
+        
+        # Check if size matches expected dimensions
+        match = _SPEC_RE.search(pdf_path.name)
+        if match:
+            (expected_w, expected_h), label = SIZE_SPECS[match.group(1)]
+            if abs(width_mm - expected_w) < SIZE_TOLERANCE_MM and abs(height_mm - expected_h) < SIZE_TOLERANCE_MM:
+                _out(f"   ✅ Dimensions match {label}")
+            else:
+                _out(f"   ⚠️  Expected ~{expected_w}×{expected_h}mm")
+        
+        # Metadata (read from the trailer so a missing Info dict isn't created)
+        info = reader.trailer.get('/Info')
+        if info:
+            _out(f"   Creator: {info.get('/Creator', 'N/A')}")
+            _out(f"   Producer: {info.get('/Producer', 'N/A')}")
+        
+        return True
     except Exception as e:
-        print(f"   ❌ Could not read metadata: {e}")
+        _out_error(f"   ❌ Could not read metadata: {e}")
         return False
 
 
-def check_color_space(pdf_path):
+def check_color_space(reader, page0, pdf_path):
     """Check color space information."""
-    print("\n🎨 Color Space Check:")
+    _out("\n🎨 Color Space Check:")
     try:
-        with open(pdf_path, 'rb') as f:
-            pdf = PyPDF2.PdfReader(f)
-            page = pdf.pages[0]
-            
-            # Look for color space info
-            resources = page.get('/Resources', {})
-            colorspace = resources.get('/ColorSpace', {})
-            
-            if colorspace:
-                print(f"   Color spaces found: {list(colorspace.keys())}")
-            else:
-                print("   ℹ️  No explicit color space metadata")
-            
-            print("   ⚠️  Manual verification recommended:")
-            print("      - Open in Adobe Acrobat Pro")
-            print("      - Check Output Preview (Shift+Cmd+Y)")
-            print("      - Verify CMYK mode")
-            
-            return None
+        # Look for color space info
+        resources = page0.get('/Resources', {})
+        colorspace = resources.get('/ColorSpace', {})
+        
+        if colorspace:
+            _out(f"   Color spaces found: {list(colorspace.keys())}")
+        else:
+            _out("   ℹ️  No explicit color space metadata")
+        
+        _out("   ⚠️  Manual verification recommended:")
+        _out("      - Open in Adobe Acrobat Pro")
+        _out("      - Check Output Preview (Shift+Cmd+Y)")
+        _out("      - Verify CMYK mode")
+        
+        return None
     except Exception as e:
-        print(f"   ⚠️  Could not check color space: {e}")
+        _out_error(f"   ⚠️  Could not check color space: {e}")
         return None
 
 
-def check_file_integrity(pdf_path):
-    """Basic file integrity checks."""
-    print("\n🔍 File Integrity:")
+def check_file_integrity(reader, page0, pdf_path, file_size):
+    """Basic file integrity checks (file_size comes from main()'s single stat)."""
+    _out("\n🔍 File Integrity:")
     try:
-        file_size = Path(pdf_path).stat().st_size
-        print(f"   File size: {file_size:,} bytes ({file_size/1024/1024:.2f} MB)")
+        _out(f"   File size: {file_size:,} bytes ({file_size/1024/1024:.2f} MB)")
         
         if file_size < 1000:
-            print("   ❌ File suspiciously small")
+            _out("   ❌ File suspiciously small")
             return False
         
-        with open(pdf_path, 'rb') as f:
-            pdf = PyPDF2.PdfReader(f)
-            
-            if pdf.is_encrypted:
-                print("   ⚠️  PDF is encrypted")
-                return None
-            
-            # Try to read first page
-            page = pdf.pages[0]
-            _ = page.mediabox
-            
-            print("   ✅ PDF structure valid")
-            return True
+        if reader.is_encrypted:
+            _out("   ⚠️  PDF is encrypted")
+            return None
+        
+        # Try to read first page
+        _ = page0.mediabox
+        
+        _out("   ✅ PDF structure valid")
+        return True
             
     except Exception as e:
-        print(f"   ❌ File integrity issue: {e}")
+        _out_error(f"   ❌ File integrity issue: {e}")
         return False
 
 
-def check_images_embedded(pdf_path):
+def check_images_embedded(doc):
     """Check for embedded images."""
-    print("\n🖼️  Image Embedding:")
+    _out("\n🖼️  Image Embedding:")
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            page = pdf.pages[0]
-            images = page.images
-            
-            if images:
-                print(f"   Found {len(images)} image(s)")
-                for i, img in enumerate(images[:3], 1):  # Show first 3
-                    print(f"   Image {i}: {img.get('width', '?')}×{img.get('height', '?')}px")
-                print("   ℹ️  Images appear to be embedded")
-                return True
-            else:
-                print("   ℹ️  No images detected (or fully converted to vectors)")
-                return True
+        if pymupdf is not None:
+            # (xref, smask, width, height, ...) straight from the image dictionaries
+            images = [(info[2], info[3]) for info in doc[0].get_images(full=True)]
+        else:
+            images = _page_images(_first_page(doc))
+        
+        if images:
+            _out(f"   Found {len(images)} image(s)")
+            for i, (width, height) in enumerate(images[:3], 1):  # Show first 3
+                _out(f"   Image {i}: {width}×{height}px")
+            _out("   ℹ️  Images appear to be embedded")
+            return True
+        else:
+            _out("   ℹ️  No images detected (or fully converted to vectors)")
+            return True
     except Exception as e:
-        print(f"   ⚠️  Could not check images: {e}")
+        _out_error(f"   ⚠️  Could not check images: {e}")
         return None
 
 
-def print_manual_checklist():
-    """Print manual verification steps."""
-    print("\n" + "="*60)
-    print("📋 MANUAL VERIFICATION CHECKLIST")
-    print("="*60)
-    print("""
+MANUAL_CHECKLIST = """
 1. ✓ Open PDF in Adobe Acrobat Pro or professional PDF viewer
    
 2. ✓ Try to select text with cursor
@@ -235,64 +361,268 @@ def print_manual_checklist():
 10. ✓ Final review with requirements.md
     → Cross-reference all specifications
     → Confirm compliance before submission
-""")
+"""
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python verify_print_ready.py <pdf_path>")
-        print("\nExample:")
-        print("  python verify_print_ready.py output/Backwall_100x217cm_bleed5mm_CMYK_PRINT_READY.pdf")
-        sys.exit(1)
+def print_manual_checklist():
+    """Print manual verification steps."""
+    _out("\n" + "="*60)
+    _out("📋 MANUAL VERIFICATION CHECKLIST")
+    _out("="*60)
+    _out(MANUAL_CHECKLIST)
+
+
+def _run_checks(checks):
+    """Run (name, check, args) entries in order, capturing each one's output.
+
+    Returns a list of (name, result, lines, errored).
+    """
+    completed = []
+    try:
+        for name, check, args in checks:
+            _local.out = []
+            _local.errored = False
+            result = check(*args)
+            completed.append((name, result, _local.out, _local.errored))
+    finally:
+        _local.__dict__.pop("out", None)
+        _local.__dict__.pop("errored", None)
+    return completed
+
+
+def _run_content_checks(pdf_path, file_size):
+    """Run the text check, then the image check unless it can be skipped.
+
+    Both checks share one document, opened and closed on this thread. An
+    outlined PRINT_READY export of ordinary size has already been through
+    the outlining step, so its image scan is recorded as a manual check
+    rather than paid for on every run.
+    """
+    try:
+        doc = _open_content_doc(pdf_path)
+    except Exception as e:
+        return [
+            ("Text Outlined", None, ["\n📝 Checking text conversion...", f"   ⚠️  Could not verify text: {e}"], True),
+            ("Images Embedded", None, ["\n🖼️  Image Embedding:", f"   ⚠️  Could not check images: {e}"], True),
+        ]
+    
+    try:
+        completed = _run_checks([("Text Outlined", check_text_outlined, (doc,))])
+        text_outlined = completed[0][1]
+        if text_outlined and "PRINT_READY" in pdf_path.name and file_size < IMAGE_CHECK_SKIP_MAX_BYTES:
+            completed.append(("Images Embedded", None, [
+                "\n🖼️  Image Embedding:",
+                "   ℹ️  Skipped for outlined PRINT_READY file (verify images manually)",
+            ], False))
+        else:
+            completed += _run_checks([("Images Embedded", check_images_embedded, (doc,))])
+    finally:
+        doc.close()
+    return completed
+
+
+def verify_one(pdf_path):
+    """Verify a single PDF.
+
+    Returns (exit_code, report) so batch runs can print reports in order.
+    """
+    # One stat both confirms the file exists and gives its size
+    try:
+        file_size = pdf_path.stat().st_size
+    except FileNotFoundError:
+        _out(f"❌ File not found: {pdf_path}")
+        return 1, _take_report()
     
-    pdf_path = Path(sys.argv[1])
+    cache_path = None
+    if not os.environ.get("VERIFY_NO_CACHE"):
+        try:
+            cache_path = _cache_path(pdf_path)
+        except OSError:
+            pass  # Unreadable file: verify uncached and let the checks report it
     
-    if not pdf_path.exists():
-        print(f"❌ File not found: {pdf_path}")
-        sys.exit(1)
+    cached = _load_cached(cache_path, pdf_path) if cache_path else None
+    if cached is not None:
+        exit_code, report = cached
+        checked = True
+    else:
+        exit_code, report, checked, errored = _verify(pdf_path, file_size)
+        # Only complete runs are cached; anything that failed to run may
+        # succeed next time
+        if cache_path and checked and not errored:
+            _store_cached(cache_path, pdf_path, exit_code, report)
+    
+    # Batch runs can set VERIFY_QUIET to drop the (identical) checklist
+    if checked and not os.environ.get("VERIFY_QUIET"):
+        print_manual_checklist()
+        report += _take_report()
+    return exit_code, report
+
+
+def _verify(pdf_path, file_size):
+    """Run every check on one PDF.
+
+    Returns (exit_code, report, checked, errored): checked is False when
+    the PDF could not be opened and no checks ran; errored is True when a
+    check could not run.
+    """
+    _out("="*60)
+    _out(f"🔍 PRINT-READY PDF VERIFICATION")
+    _out("="*60)
+    _out(f"File: {pdf_path.name}")
+    _out(f"Path: {pdf_path}")
     
-    print("="*60)
-    print(f"🔍 PRINT-READY PDF VERIFICATION")
-    print("="*60)
-    print(f"File: {pdf_path.name}")
-    print(f"Path: {pdf_path}")
+    # Open the PDF once; every check shares the reader and first page.
+    # pikepdf (qpdf) only resolves objects as they are accessed, so the
+    # structural checks never read the bulk of large image streams.
+    try:
+        reader = pikepdf.open(pdf_path)
+    except pikepdf.PasswordError:
+        _out("\n❌ PDF is encrypted and needs a password")
+        return 1, _take_report(), False, False
+    except Exception as e:
+        _out(f"\n❌ Could not parse PDF: {e}")
+        return 1, _take_report(), False, True
     
-    # Run all checks
+    with reader:
+        try:
+            page0 = _first_page(reader)
+        except Exception as e:
+            _out(f"\n❌ Could not read first page: {e}")
+            return 1, _take_report(), False, True
+        
+        args = (reader, page0, pdf_path)
+        
+        # Neither a pikepdf nor a PyMuPDF document may be used from two
+        # threads at once, so the checks run as two concurrent lanes: the
+        # structure checks on the shared pikepdf reader, and the content
+        # checks on their own PyMuPDF (or second pikepdf) document.
+        structure_checks = [
+            ("File Integrity", check_file_integrity, args + (file_size,)),
+            ("PDF Metadata", check_pdf_metadata, args),
+            ("Fonts Embedded", check_fonts_embedded, args),
+            ("Color Space", check_color_space, args),
+        ]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            lanes = [
+                executor.submit(_run_checks, structure_checks),
+                executor.submit(_run_content_checks, pdf_path, file_size),
+            ]
+            completed = {name: rest for lane in lanes for name, *rest in lane.result()}
+    
+    # Report in the usual order regardless of which lane finished first
     results = []
-    results.append(("File Integrity", check_file_integrity(pdf_path)))
-    results.append(("PDF Metadata", check_pdf_metadata(pdf_path)))
-    results.append(("Text Outlined", check_text_outlined(pdf_path)))
-    results.append(("Fonts Embedded", check_fonts_embedded(pdf_path)))
-    results.append(("Images Embedded", check_images_embedded(pdf_path)))
-    results.append(("Color Space", check_color_space(pdf_path)))
+    errored = False
+    for name in CHECK_ORDER:
+        result, lines, check_errored = completed[name]
+        _OUT.extend(lines)
+        results.append((name, result))
+        errored = errored or check_errored
     
     # Summary
-    print("\n" + "="*60)
-    print("📊 VERIFICATION SUMMARY")
-    print("="*60)
+    _out("\n" + "="*60)
+    _out("📊 VERIFICATION SUMMARY")
+    _out("="*60)
     
     passed = sum(1 for _, r in results if r is True)
     failed = sum(1 for _, r in results if r is False)
     warnings = sum(1 for _, r in results if r is None)
     
-    for check, result in results:
-        status = "✅ PASS" if result is True else "❌ FAIL" if result is False else "⚠️  MANUAL"
-        print(f"{status:12} {check}")
+    _out("\n".join(_STATUS[result] + check for check, result in results))
     
-    print(f"\nPassed: {passed} | Failed: {failed} | Manual: {warnings}")
+    _out(f"\nPassed: {passed} | Failed: {failed} | Manual: {warnings}")
     
     if failed > 0:
-        print("\n❌ PDF has issues that must be resolved before printing")
-        print_manual_checklist()
-        sys.exit(1)
+        _out("\n❌ PDF has issues that must be resolved before printing")
+        exit_code = 1
     elif warnings > 0:
-        print("\n⚠️  PDF requires manual verification (see checklist below)")
-        print_manual_checklist()
-        sys.exit(0)
+        _out("\n⚠️  PDF requires manual verification (see checklist below)")
+        exit_code = 0
     else:
-        print("\n✅ All automated checks passed!")
-        print_manual_checklist()
-        sys.exit(0)
+        _out("\n✅ All automated checks passed!")
+        exit_code = 0
+    
+    return exit_code, _take_report(), True, errored
+
+
+def _cache_path(pdf_path):
+    """Return the cache file for a PDF, named after the MD5 of its contents."""
+    digest = hashlib.md5()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return _CACHE_DIR / f"{digest.hexdigest()}.json"
+
+
+def _load_cached(cache_path, pdf_path):
+    """Return the cached (exit_code, report) for this file, or None."""
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # The report quotes the path and the checks read the file name, so a
+    # copy of the same bytes under another name is verified afresh
+    if entry.get("version") != _CACHE_VERSION or entry.get("path") != str(pdf_path):
+        return None
+    return entry["exit_code"], entry["report"]
+
+
+def _store_cached(cache_path, pdf_path, exit_code, report):
+    """Save a report to the cache; a read-only cache dir is not an error."""
+    entry = {
+        "version": _CACHE_VERSION,
+        "path": str(pdf_path),
+        "exit_code": exit_code,
+        "report": report,
+        "timestamp": time.time(),
+    }
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entry), encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _expand_paths(args):
+    """Turn command-line arguments into PDF paths, expanding directories."""
+    paths = []
+    for arg in args:
+        path = Path(arg)
+        if path.is_dir():
+            paths.extend(sorted(path.glob("*.pdf")))
+        else:
+            paths.append(path)
+    return paths
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python verify_print_ready.py <pdf_path|directory> [...]")
+        print("\nExample:")
+        print("  python verify_print_ready.py output/Backwall_100x217cm_bleed5mm_CMYK_PRINT_READY.pdf")
+        print("  python verify_print_ready.py output/")
+        sys.exit(1)
+    
+    pdf_paths = _expand_paths(sys.argv[1:])
+    if not pdf_paths:
+        print("❌ No PDF files found")
+        sys.exit(1)
+    
+    if len(pdf_paths) == 1:
+        exit_code, report = verify_one(pdf_paths[0])
+        sys.stdout.write(report)
+        sys.exit(exit_code)
+    
+    # Several files: a small pool amortises the imports across files; more
+    # than 4 workers mostly just contend for disk
+    exit_code = 0
+    with multiprocessing.Pool(processes=min(os.cpu_count() or 1, 4, len(pdf_paths))) as pool:
+        for file_exit_code, report in pool.imap(verify_one, pdf_paths):
+            sys.stdout.write(report + "\n")
+            exit_code = max(exit_code, file_exit_code)
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":